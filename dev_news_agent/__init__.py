@@ -1 +1,11 @@
-from . import agent
\ No newline at end of file
+import importlib
+
+__all__ = ["agent"]
+
+
+def __getattr__(name):
+    # Import the agent tree on first access only, so that worker processes
+    # which just need a helper module (e.g. the feed parser) skip google-adk.
+    if name == "agent":
+        return importlib.import_module(".agent", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
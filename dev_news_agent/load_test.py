@@ -0,0 +1,126 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Load test for the multi-process serving mode.
+
+Seeds the shared feed cache with synthetic feeds (so no network or LLM calls
+are made), then runs the same batch of `get_news_from_rss` jobs through
+NewsWorkerPool, first with an increasing number of workers and then with an
+increasing feed parsing pool inside a single worker, and reports throughput.
+
+Usage:
+    python -m dev_news_agent.load_test --requests 200 --entries 500
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from .serving import NewsWorkerPool
+from .tools import rss_feed
+from .shared_libraries.feed_cache import FeedCache
+
+WORDS = [
+    "openai", "gemini", "claude", "api", "sdk", "release", "model", "agent",
+    "developer", "tooling", "python", "latency", "benchmark", "launch", "docs",
+]
+
+
+def _synthetic_feed(entries: int, rng: random.Random) -> bytes:
+    items = []
+    for i in range(entries):
+        title = " ".join(rng.choices(WORDS, k=8))
+        summary = " ".join(rng.choices(WORDS, k=60))
+        items.append(
+            f"<item><title>{title}</title><link>https://example.com/{i}</link>"
+            f"<description>{summary}</description>"
+            f"<pubDate>Mon, 13 May 2024 00:00:00 GMT</pubDate></item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f"<title>Synthetic</title>{''.join(items)}</channel></rss>"
+    ).encode("utf-8")
+
+
+async def _rss_job(keywords: list[str]) -> int:
+    return len(await rss_feed.get_news_from_rss(keywords))
+
+
+def _warm_up() -> None:
+    # Runs in each worker before it reports ready, so imports, the parse pool
+    # and the page cache are all warm before the timed run starts.
+    rss_feed.get_news_from_rss_sync(WORDS[:1])
+
+
+def _run(jobs: list, num_workers: int, max_sessions: int, parse_workers: int) -> float:
+    with NewsWorkerPool(
+        num_workers,
+        target=_rss_job,
+        max_sessions=max_sessions,
+        parse_workers=parse_workers,
+        initializer=_warm_up,
+    ) as pool:
+        start = time.perf_counter()
+        pool.map(jobs)
+        elapsed = time.perf_counter() - start
+    return len(jobs) / elapsed
+
+
+def _report(label: str, counts: list[int], run) -> None:
+    print(f"{label:>14} {'req/s':>10} {'speedup':>8}")
+    baseline = None
+    for count in counts:
+        throughput = run(count)
+        baseline = baseline or throughput
+        print(f"{count:>14} {throughput:>10.1f} {throughput / baseline:>7.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure serving throughput against worker count.")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--entries", type=int, default=500, help="Entries per synthetic feed.")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--sessions", type=int, default=4, help="Concurrent jobs per worker.")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    jobs = [rng.sample(WORDS, k=3) for _ in range(args.requests)]
+    counts = sorted({1, *(2 ** i for i in range(1, args.max_workers.bit_length())), args.max_workers})
+
+    saved_env = {key: os.environ.get(key) for key in ("FEED_CACHE_DIR", "FEED_CACHE_TTL")}
+    with tempfile.TemporaryDirectory(prefix="dev_news_load_test_") as cache_dir:
+        # Spawned workers read their cache settings from the environment, so
+        # they share this seeded directory and never fall back to the network.
+        os.environ["FEED_CACHE_DIR"] = cache_dir
+        os.environ["FEED_CACHE_TTL"] = str(24 * 60 * 60)
+        try:
+            cache = FeedCache(cache_dir, ttl=24 * 60 * 60)
+            for url in rss_feed.RSS_FEED_URLS:
+                cache.put(url, _synthetic_feed(args.entries, rng))
+
+            _report("workers", counts, lambda n: _run(jobs, n, args.sessions, parse_workers=0))
+            print()
+            _report("parse workers", [0, *counts], lambda n: _run(jobs, 1, args.sessions, parse_workers=n))
+        finally:
+            for key, value in saved_env.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Multi-process serving mode for running many orchestrator sessions at once.
+
+Usage:
+    python -m dev_news_agent.serving --workers 4 "GPT-4o news" "Gemini API updates"
+    cat queries.txt | python -m dev_news_agent.serving --workers 4
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import multiprocessing
+import pickle
+import queue
+import sys
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Optional
+
+from .shared_libraries import constants
+from .shared_libraries import feed_parser
+
+logger = logging.getLogger(__name__)
+
+# How often a waiting parent (or worker) re-checks that the other side is still alive.
+_POLL_INTERVAL = 1.0
+
+_runner = None
+
+
+def _get_runner():
+    """Lazily creates the per-process Runner around root_agent."""
+    global _runner
+    if _runner is None:
+        # Imported here so that worker processes running other targets (and
+        # the load test) never load google-adk or build the agent tree.
+        from google.adk.runners import Runner
+        from google.adk.sessions import InMemorySessionService
+
+        from .agent import root_agent
+
+        _runner = Runner(
+            agent=root_agent,
+            app_name=constants.AGENT_NAME,
+            session_service=InMemorySessionService(),
+        )
+    return _runner
+
+
+async def run_session(query: str) -> dict:
+    """Runs one orchestrator session for a query and returns its fetched news."""
+    from google.genai import types
+
+    runner = _get_runner()
+    user_id = f"user_{uuid.uuid4().hex}"
+    session = await runner.session_service.create_session(
+        app_name=constants.AGENT_NAME,
+        user_id=user_id,
+        state={"query": query},
+    )
+    message = types.Content(role="user", parts=[types.Part(text=query)])
+    try:
+        async for _ in runner.run_async(user_id=user_id, session_id=session.id, new_message=message):
+            pass
+        session = await runner.session_service.get_session(
+            app_name=constants.AGENT_NAME,
+            user_id=user_id,
+            session_id=session.id,
+        )
+        return session.state.get("fetched_news", {})
+    finally:
+        await runner.session_service.delete_session(
+            app_name=constants.AGENT_NAME,
+            user_id=user_id,
+            session_id=session.id,
+        )
+
+
+async def _run_job(job_id: int, payload: Any, target: Callable[[Any], Awaitable[Any]], result_queue) -> None:
+    try:
+        # Pickle here rather than in the queue's feeder thread, where a failure
+        # would be dropped silently and leave the parent waiting forever.
+        data = pickle.dumps(await target(payload))
+    except Exception as e:
+        logger.exception(f"Job {job_id} failed.")
+        result_queue.put((job_id, None, repr(e)))
+        return
+    result_queue.put((job_id, data, None))
+
+
+def _next_task(task_queue):
+    """Blocks for the next job, returning None once the parent process is gone."""
+    parent = multiprocessing.parent_process()
+    while True:
+        try:
+            return task_queue.get(timeout=_POLL_INTERVAL)
+        except queue.Empty:
+            if parent is not None and not parent.is_alive():
+                return None
+
+
+async def _worker_loop(task_queue, result_queue, target: Callable[[Any], Awaitable[Any]], max_sessions: int) -> None:
+    loop = asyncio.get_running_loop()
+    # Only take a job off the shared queue once there is capacity for it, so
+    # idle workers pick up the remaining jobs instead of this one hoarding them.
+    capacity = asyncio.Semaphore(max_sessions)
+    running = set()
+    while True:
+        await capacity.acquire()
+        item = await loop.run_in_executor(None, _next_task, task_queue)
+        if item is None:
+            capacity.release()
+            break
+        job_id, payload = item
+        task = asyncio.create_task(_run_job(job_id, payload, target, result_queue))
+        running.add(task)
+        task.add_done_callback(running.discard)
+        task.add_done_callback(lambda _: capacity.release())
+    if running:
+        await asyncio.gather(*running)
+
+
+def _worker_main(
+    task_queue,
+    result_queue,
+    ready_queue,
+    target: Callable[[Any], Awaitable[Any]],
+    max_sessions: int,
+    parse_workers: int,
+    initializer: Optional[Callable[[], None]],
+) -> None:
+    name = multiprocessing.current_process().name
+    try:
+        feed_parser.set_parse_workers(parse_workers)
+        if initializer is not None:
+            initializer()
+    except Exception as e:
+        logger.exception(f"Worker {name} failed to initialize.")
+        ready_queue.put((name, repr(e)))
+        return
+    ready_queue.put((name, None))
+    try:
+        asyncio.run(_worker_loop(task_queue, result_queue, target, max_sessions))
+    finally:
+        feed_parser.set_parse_workers(0)
+
+
+class NewsWorkerPool:
+    """
+    Runs N worker processes that pull jobs from a shared local queue.
+
+    Each worker owns its own event loop and drives up to `max_sessions` jobs
+    concurrently, so CPU-bound work in one session only stalls the sessions
+    of that worker rather than every session.
+    """
+
+    def __init__(
+        self,
+        num_workers: int = constants.NUM_WORKERS,
+        target: Callable[[Any], Awaitable[Any]] = run_session,
+        max_sessions: int = constants.MAX_SESSIONS_PER_WORKER,
+        parse_workers: int = 0,
+        initializer: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Initializes the NewsWorkerPool.
+
+        Args:
+            num_workers: Number of worker processes.
+            target: Module-level coroutine function run for each job payload.
+            max_sessions: Maximum concurrent jobs per worker.
+            parse_workers: Feed parsing pool size inside each worker. Defaults
+                to 0 because the workers already spread parsing across cores.
+            initializer: Module-level function each worker runs before it
+                reports ready, e.g. to import and build the agent up front.
+        """
+        self.num_workers = num_workers
+        self.target = target
+        self.max_sessions = max_sessions
+        self.parse_workers = parse_workers
+        self.initializer = initializer
+        self._ctx = multiprocessing.get_context("spawn")
+        self._task_queue = self._ctx.Queue()
+        self._result_queue = self._ctx.Queue()
+        self._ready_queue = self._ctx.Queue()
+        self._job_ids = itertools.count()
+        self._processes = []
+
+    def _check_workers(self) -> None:
+        for process in self._processes:
+            if process.exitcode is not None:
+                raise RuntimeError(f"Worker {process.name} exited unexpectedly with code {process.exitcode}.")
+
+    def _get(self, source, timeout: Optional[float]):
+        """Waits for an item from one of the queues, failing fast if a worker dies."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = _POLL_INTERVAL if deadline is None else max(0.0, min(_POLL_INTERVAL, deadline - time.monotonic()))
+            try:
+                return source.get(timeout=wait)
+            except queue.Empty:
+                self._check_workers()
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise
+
+    def start(self, timeout: Optional[float] = None) -> None:
+        """Starts the worker processes and waits until each one is ready."""
+        for i in range(self.num_workers):
+            # Not daemonic: daemon processes cannot start a feed parsing pool.
+            process = self._ctx.Process(
+                target=_worker_main,
+                args=(
+                    self._task_queue,
+                    self._result_queue,
+                    self._ready_queue,
+                    self.target,
+                    self.max_sessions,
+                    self.parse_workers,
+                    self.initializer,
+                ),
+                name=f"NewsWorker-{i}",
+            )
+            process.start()
+            self._processes.append(process)
+        try:
+            for _ in self._processes:
+                name, error = self._get(self._ready_queue, timeout)
+                if error is not None:
+                    raise RuntimeError(f"Worker {name} failed to initialize: {error}")
+        except BaseException:
+            # Workers are not daemonic, so any left running would block interpreter exit.
+            self.close()
+            raise
+        logger.info(f"Started {self.num_workers} news workers.")
+
+    def submit(self, payload: Any) -> int:
+        """Queues a job and returns its id."""
+        job_id = next(self._job_ids)
+        self._task_queue.put((job_id, payload))
+        return job_id
+
+    def get_result(self, timeout: Optional[float] = None) -> tuple[int, Any, Optional[str]]:
+        """
+        Returns the next finished job as (job_id, result, error).
+
+        Raises queue.Empty if nothing finishes within `timeout` seconds, and
+        RuntimeError if a worker process has died.
+        """
+        job_id, data, error = self._get(self._result_queue, timeout)
+        return job_id, (pickle.loads(data) if data is not None else None), error
+
+    def map(self, payloads: list, timeout: Optional[float] = None) -> list:
+        """Runs all payloads and returns their results in order, raising on the first failed job."""
+        job_ids = [self.submit(payload) for payload in payloads]
+        pending = set(job_ids)
+        results = {}
+        first_error = None
+        # Wait for the whole batch even after a failure, so no results of this
+        # batch are left in the queue for the next caller.
+        while pending:
+            job_id, result, error = self.get_result(timeout)
+            if job_id not in pending:
+                continue
+            pending.discard(job_id)
+            if error is not None and first_error is None:
+                first_error = f"Job {job_id} failed: {error}"
+            results[job_id] = result
+        if first_error is not None:
+            raise RuntimeError(first_error)
+        return [results[job_id] for job_id in job_ids]
+
+    def close(self, timeout: float = 30.0) -> None:
+        """Lets the workers finish their queued jobs and stops them, terminating any still running after `timeout`."""
+        for process in self._processes:
+            if process.is_alive():
+                self._task_queue.put(None)
+        deadline = time.monotonic() + timeout
+        for process in self._processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.warning(f"Worker {process.name} did not stop within {timeout}s; terminating it.")
+                process.terminate()
+                process.join()
+        self._processes = []
+
+    def __enter__(self) -> "NewsWorkerPool":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve dev news queries with multiple worker processes.")
+    parser.add_argument("queries", nargs="*", help="Queries to run; read from stdin (one per line) if omitted.")
+    parser.add_argument("--workers", type=int, default=constants.NUM_WORKERS)
+    parser.add_argument("--max-sessions", type=int, default=constants.MAX_SESSIONS_PER_WORKER)
+    args = parser.parse_args()
+
+    queries = args.queries or [line.strip() for line in sys.stdin if line.strip()]
+    logging.basicConfig(level=logging.INFO)
+
+    with NewsWorkerPool(
+        args.workers,
+        max_sessions=args.max_sessions,
+        initializer=_get_runner,
+    ) as pool:
+        job_queries = {pool.submit(query): query for query in queries}
+        for _ in job_queries:
+            job_id, result, error = pool.get_result()
+            print(json.dumps({"query": job_queries[job_id], "fetched_news": result, "error": error}))
+
+
+if __name__ == "__main__":
+    main()
@@ -29,6 +29,19 @@ DISABLE_WEB_DRIVER = int(os.getenv("DISABLE_WEB_DRIVER", "0"))
 HEADLESS_MODE = os.getenv("HEADLESS_MODE", "true").lower() == "true"
 BROWSER_TIMEOUT = int(os.getenv("BROWSER_TIMEOUT", "30000"))  # 30 seconds
 
+# Serving configuration
+NUM_WORKERS = int(os.getenv("NUM_WORKERS", str(os.cpu_count() or 1)))
+MAX_SESSIONS_PER_WORKER = int(os.getenv("MAX_SESSIONS_PER_WORKER", "8"))
+FEED_PARSE_WORKERS = int(os.getenv("FEED_PARSE_WORKERS", "0"))  # 0 parses in a thread instead of a process pool
+
+# Feed cache configuration (shared across worker processes)
+FEED_CACHE_DIR = os.path.expanduser(os.getenv(
+    "FEED_CACHE_DIR",
+    os.path.join(os.getenv("XDG_CACHE_HOME", "~/.cache"), AGENT_NAME, "feeds"),
+))
+FEED_CACHE_TTL = int(os.getenv("FEED_CACHE_TTL", "300"))  # 5 minutes
+FEED_FETCH_TIMEOUT = int(os.getenv("FEED_FETCH_TIMEOUT", "10"))  # 10 seconds
+
 # News sources configuration
 NEWS_SOURCES = {
     "techcrunch": {
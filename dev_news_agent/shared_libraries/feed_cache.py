@@ -0,0 +1,94 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""File-backed feed cache shared between worker processes."""
+
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class FeedCache:
+    """
+    Stores raw feed documents as one file per URL in a shared directory.
+
+    Entries are written atomically (temp file + rename), so any number of
+    processes can read and refresh the cache concurrently, and a feed fetched
+    by one worker is reused by all of them until its TTL expires.
+    """
+
+    def __init__(self, directory: str, ttl: int):
+        """
+        Initializes the FeedCache.
+
+        Args:
+            directory: Directory holding the cached feed files.
+            ttl: Seconds a cached feed stays fresh.
+        """
+        self.directory = directory
+        self.ttl = ttl
+
+    def path_for(self, url: str) -> str:
+        """Returns the cache file path for a feed URL."""
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.xml")
+
+    def is_fresh(self, url: str) -> bool:
+        """Returns True if a cached copy of the feed exists and is within its TTL."""
+        try:
+            mtime = os.path.getmtime(self.path_for(url))
+        except OSError:
+            return False
+        return time.time() - mtime < self.ttl
+
+    def exists(self, url: str) -> bool:
+        """Returns True if any cached copy of the feed exists, fresh or stale."""
+        return os.path.exists(self.path_for(url))
+
+    def _ensure_directory(self) -> None:
+        """Creates the cache directory as private to the current user and checks its owner."""
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        # A directory created by someone else could hold planted feed files.
+        if hasattr(os, "getuid") and os.stat(self.directory).st_uid != os.getuid():
+            raise PermissionError(f"Feed cache directory {self.directory} is not owned by the current user.")
+
+    def put(self, url: str, data: bytes) -> str:
+        """Atomically stores a feed document and returns its cache path."""
+        self._ensure_directory()
+        path = self.path_for(url)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return path
+
+
+def read_cached_feed(path: str) -> Optional[bytes]:
+    """Reads a cached feed file; returns None if it is missing or empty."""
+    try:
+        with open(path, "rb") as f:
+            return f.read() or None
+    except FileNotFoundError:
+        logger.warning(f"Cached feed {path} disappeared before it could be read.")
+        return None
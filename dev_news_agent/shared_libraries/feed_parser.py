@@ -0,0 +1,76 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Feed parsing and keyword filtering, run in a process pool.
+
+This module is what the pool's spawned children import, so it must stay free
+of google-adk and the agent tree.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import feedparser
+
+from . import constants
+from .feed_cache import read_cached_feed
+
+_parse_workers = constants.FEED_PARSE_WORKERS
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+def set_parse_workers(num_workers: int) -> None:
+    """Sets the size of the feed parsing process pool; 0 disables the pool."""
+    global _parse_workers, _parse_pool
+    if num_workers > 0 and multiprocessing.current_process().daemon:
+        raise ValueError("Daemon processes cannot start a feed parsing pool; use 0 parse workers.")
+    if _parse_pool is not None:
+        _parse_pool.shutdown()
+        _parse_pool = None
+    _parse_workers = num_workers
+
+
+def get_parse_pool() -> Optional[ProcessPoolExecutor]:
+    """Returns the feed parsing process pool, creating it on first use, or None if disabled."""
+    global _parse_pool
+    if _parse_workers <= 0:
+        return None
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=_parse_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _parse_pool
+
+
+def parse_and_filter(path: str, keywords: list[str]) -> list[dict]:
+    """Parses a cached feed file and returns the entries matching any of the keywords."""
+    data = read_cached_feed(path)
+    if data is None:
+        return []
+    feed = feedparser.parse(data)
+    lowered_keywords = [keyword.lower() for keyword in keywords]
+    news = []
+    for entry in feed.entries:
+        title = entry.title.lower()
+        summary = entry.summary.lower() if hasattr(entry, 'summary') else ''
+        if any(keyword in title or keyword in summary for keyword in lowered_keywords):
+            news.append({
+                "title": entry.title,
+                "link": entry.link,
+                "summary": entry.summary if hasattr(entry, 'summary') else '',
+                "published": entry.published if hasattr(entry, 'published') else ''
+            })
+    return news
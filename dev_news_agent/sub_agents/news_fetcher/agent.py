@@ -22,6 +22,8 @@ def create_news_fetcher_agent(model: str, output_key: str) -> LlmAgent:
             }
         }
         """,
+        # google_search is a built-in tool and cannot share an agent with function tools.
+        tools=[get_news_from_rss],
         output_key=output_key
     )
         
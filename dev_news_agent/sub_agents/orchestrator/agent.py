@@ -177,6 +177,9 @@ class NewsOrchestratorAgent(BaseAgent):
                 fetched_news[k] = result
 
         ctx.session.state["fetched_news"] = fetched_news
-        logger.info(f"[{self.name}] All fetched news: {json.dumps(fetched_news, indent=2)}")
+        logger.info(f"[{self.name}] Fetched news for keywords: {list(fetched_news)}")
+        # Serializing the full payload is CPU heavy and blocks the event loop, so only do it for debugging.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[{self.name}] All fetched news: {json.dumps(fetched_news, indent=2)}")
 
         logger.info(f"[{self.name}] News orchestration workflow finished.")
\ No newline at end of file
@@ -1,32 +1,88 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
 import feedparser
+import requests
+
+from ..shared_libraries import constants
+from ..shared_libraries import feed_parser
+from ..shared_libraries.feed_cache import FeedCache
+
+logger = logging.getLogger(__name__)
+
+RSS_FEED_URLS = [
+    "https://www.wired.com/feed/category/business/latest/rss",
+    "https://feeds.arstechnica.com/arstechnica/index/",
+    "http://feeds.feedburner.com/TechCrunch/",
+    "https://www.theverge.com/rss/index.xml",
+    "https://www.infoq.com/feed/ai-ml-dl/",
+    "https://www.zdnet.com/blog/ai/rss.xml",
+    "https://venturebeat.com/category/ai/feed/",
+    "https://www.techrepublic.com/rssfeeds/topic/artificial-intelligence/",
+    "https://developer.nvidia.com/blog/feed/",
+    "https://openai.com/blog/rss.xml",
+    "https://www.anthropic.com/newsroom/rss.xml",
+    "https://deepmind.google/blog/rss/"
+]
+
+feed_cache = FeedCache(constants.FEED_CACHE_DIR, constants.FEED_CACHE_TTL)
+
+
+def _fetch_feed(url: str) -> Optional[str]:
+    """Returns the cache path for a feed, downloading it if the cached copy is stale."""
+    if feed_cache.is_fresh(url):
+        return feed_cache.path_for(url)
+    try:
+        response = requests.get(
+            url,
+            headers={"User-Agent": feedparser.USER_AGENT},
+            timeout=constants.FEED_FETCH_TIMEOUT,
+        )
+        response.raise_for_status()
+        return feed_cache.put(url, response.content)
+    except requests.RequestException as e:
+        if feed_cache.exists(url):
+            logger.warning(f"Failed to refresh feed {url}, using stale copy: {e}")
+            return feed_cache.path_for(url)
+        logger.warning(f"Failed to fetch feed {url}: {e}")
+        return None
 
-def get_news_from_rss(keywords: list[str]) -> list[dict]:
+
+def _parse_all(paths: list[str], keywords: list[str]) -> list[list[dict]]:
+    return [feed_parser.parse_and_filter(path, keywords) for path in paths]
+
+
+async def get_news_from_rss(keywords: list[str]) -> list[dict]:
     """Fetches news from RSS feeds based on a list of keywords."""
-    urls = [
-        "https://www.wired.com/feed/category/business/latest/rss",
-        "https://feeds.arstechnica.com/arstechnica/index/",
-        "http://feeds.feedburner.com/TechCrunch/",
-        "https://www.theverge.com/rss/index.xml",
-        "https://www.infoq.com/feed/ai-ml-dl/",
-        "https://www.zdnet.com/blog/ai/rss.xml",
-        "https://venturebeat.com/category/ai/feed/",
-        "https://www.techrepublic.com/rssfeeds/topic/artificial-intelligence/",
-        "https://developer.nvidia.com/blog/feed/",
-        "https://openai.com/blog/rss.xml",
-        "https://www.anthropic.com/newsroom/rss.xml",
-        "https://deepmind.google/blog/rss/"
-    ]
+    # Downloads block on the network, so run them concurrently off the event loop.
+    paths = await asyncio.gather(*(asyncio.to_thread(_fetch_feed, url) for url in RSS_FEED_URLS))
+    paths = [path for path in paths if path]
+
+    # Parsing and keyword matching are CPU bound; pool workers read the feeds
+    # from the shared cache themselves, so only paths and matches cross processes.
+    pool = feed_parser.get_parse_pool()
+    if pool is None:
+        results = await asyncio.to_thread(_parse_all, paths, keywords)
+    else:
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(pool, feed_parser.parse_and_filter, path, keywords) for path in paths)
+        )
+
     all_news = []
-    for url in urls:
-        feed = feedparser.parse(url)
-        for entry in feed.entries:
-            for keyword in keywords:
-                if keyword.lower() in entry.title.lower() or (hasattr(entry, 'summary') and keyword.lower() in entry.summary.lower()):
-                    all_news.append({
-                        "title": entry.title,
-                        "link": entry.link,
-                        "summary": entry.summary if hasattr(entry, 'summary') else '',
-                        "published": entry.published if hasattr(entry, 'published') else ''
-                    })
-                    break # Move to the next entry once a keyword is found
+    for news in results:
+        all_news.extend(news)
     return all_news
+
+
+def get_news_from_rss_sync(keywords: list[str]) -> list[dict]:
+    """Blocking version of get_news_from_rss, usable from any thread."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(get_news_from_rss(keywords))
+    # asyncio.run cannot nest inside a running loop, so use a private thread.
+    with ThreadPoolExecutor(max_workers=1) as runner:
+        return runner.submit(asyncio.run, get_news_from_rss(keywords)).result()
@@ -0,0 +1,58 @@
+import os
+import time
+from unittest import mock
+
+import pytest
+
+from dev_news_agent.shared_libraries.feed_cache import FeedCache, read_cached_feed
+
+URL = "https://example.com/feed.xml"
+
+
+def test_put_stores_feed_and_leaves_no_temp_files(tmp_path):
+    cache = FeedCache(str(tmp_path / "feeds"), ttl=60)
+
+    cache.put(URL, b"old")
+    path = cache.put(URL, b"new")
+
+    assert path == cache.path_for(URL)
+    assert read_cached_feed(path) == b"new"
+    assert os.listdir(cache.directory) == [os.path.basename(path)]
+
+
+def test_is_fresh_respects_ttl(tmp_path):
+    cache = FeedCache(str(tmp_path), ttl=60)
+    assert not cache.is_fresh(URL)
+
+    path = cache.put(URL, b"<rss/>")
+    assert cache.is_fresh(URL)
+
+    stale = time.time() - 120
+    os.utime(path, (stale, stale))
+    assert not cache.is_fresh(URL)
+    assert cache.exists(URL)
+
+
+def test_read_cached_feed_missing_or_empty(tmp_path):
+    empty = tmp_path / "empty.xml"
+    empty.write_bytes(b"")
+
+    assert read_cached_feed(str(tmp_path / "missing.xml")) is None
+    assert read_cached_feed(str(empty)) is None
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions only")
+def test_directory_is_private_to_user(tmp_path):
+    cache = FeedCache(str(tmp_path / "feeds"), ttl=60)
+    cache.put(URL, b"<rss/>")
+
+    assert os.stat(cache.directory).st_mode & 0o777 == 0o700
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions only")
+def test_refuses_directory_owned_by_another_user(tmp_path):
+    cache = FeedCache(str(tmp_path), ttl=60)
+
+    with mock.patch("os.getuid", return_value=os.getuid() + 1):
+        with pytest.raises(PermissionError):
+            cache.put(URL, b"<rss/>")
@@ -0,0 +1,95 @@
+import os
+import time
+from unittest import mock
+
+import pytest
+import requests
+
+from dev_news_agent.shared_libraries import feed_parser
+from dev_news_agent.shared_libraries.feed_cache import FeedCache
+from dev_news_agent.tools import rss_feed
+
+URL = "https://example.com/feed.xml"
+
+FEED = b"""<?xml version="1.0"?><rss version="2.0"><channel><title>Test</title>
+<item><title>Gemini API update</title><link>https://example.com/1</link>
+<description>New models</description></item>
+<item><title>Unrelated</title><link>https://example.com/2</link>
+<description>Mentions OpenAI in the summary</description></item>
+<item><title>Nothing here</title><link>https://example.com/3</link></item>
+</channel></rss>"""
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = FeedCache(str(tmp_path), ttl=60)
+    monkeypatch.setattr(rss_feed, "feed_cache", cache)
+    return cache
+
+
+def _response(content: bytes) -> mock.Mock:
+    response = mock.Mock(content=content)
+    response.raise_for_status.return_value = None
+    return response
+
+
+def test_fetch_feed_uses_fresh_copy(cache):
+    cache.put(URL, FEED)
+
+    with mock.patch("requests.get") as get:
+        assert rss_feed._fetch_feed(URL) == cache.path_for(URL)
+    get.assert_not_called()
+
+
+def test_fetch_feed_downloads_into_cache(cache):
+    with mock.patch("requests.get", return_value=_response(FEED)):
+        path = rss_feed._fetch_feed(URL)
+
+    assert path == cache.path_for(URL)
+    assert cache.is_fresh(URL)
+
+
+def test_fetch_feed_falls_back_to_stale_copy(cache):
+    path = cache.put(URL, FEED)
+    stale = time.time() - 120
+    os.utime(path, (stale, stale))
+
+    with mock.patch("requests.get", side_effect=requests.ConnectionError("offline")):
+        assert rss_feed._fetch_feed(URL) == path
+
+
+def test_fetch_feed_without_cached_copy_returns_none(cache):
+    with mock.patch("requests.get", side_effect=requests.ConnectionError("offline")):
+        assert rss_feed._fetch_feed(URL) is None
+
+
+def test_parse_and_filter_matches_title_or_summary(cache):
+    path = cache.put(URL, FEED)
+
+    news = feed_parser.parse_and_filter(path, ["GEMINI", "openai"])
+
+    assert [item["link"] for item in news] == ["https://example.com/1", "https://example.com/2"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("parse_workers", [0, 1])
+async def test_get_news_from_rss(cache, monkeypatch, parse_workers):
+    monkeypatch.setattr(rss_feed, "RSS_FEED_URLS", [URL])
+    cache.put(URL, FEED)
+    feed_parser.set_parse_workers(parse_workers)
+    try:
+        news = await rss_feed.get_news_from_rss(["gemini"])
+    finally:
+        feed_parser.set_parse_workers(0)
+
+    assert [item["title"] for item in news] == ["Gemini API update"]
+
+
+@pytest.mark.asyncio
+async def test_get_news_from_rss_sync_inside_running_loop(cache, monkeypatch):
+    monkeypatch.setattr(rss_feed, "RSS_FEED_URLS", [URL])
+    cache.put(URL, FEED)
+
+    news = rss_feed.get_news_from_rss_sync(["gemini"])
+
+    assert [item["title"] for item in news] == ["Gemini API update"]
@@ -0,0 +1,121 @@
+import asyncio
+import os
+import queue
+import time
+
+import pytest
+
+from dev_news_agent.serving import NewsWorkerPool
+from dev_news_agent.shared_libraries import feed_parser
+
+
+async def _double(value: int) -> int:
+    # Later payloads finish first, so results arrive out of submission order.
+    await asyncio.sleep(0.05 * (5 - value % 5))
+    return value * 2
+
+
+async def _fail_on_three(value: int) -> int:
+    if value == 3:
+        raise ValueError("bad payload")
+    return value
+
+
+async def _unpicklable(value: int):
+    return lambda: value
+
+
+async def _exit(value: int) -> None:
+    os._exit(1)
+
+
+async def _use_parse_pool(value: int) -> int:
+    return await asyncio.wrap_future(feed_parser.get_parse_pool().submit(abs, value))
+
+
+def _broken_initializer() -> None:
+    raise RuntimeError("no agent")
+
+
+def _slow_initializer() -> None:
+    time.sleep(5)
+
+
+def _dying_initializer() -> None:
+    os._exit(1)
+
+
+def test_map_returns_results_in_order():
+    with NewsWorkerPool(2, target=_double, max_sessions=4) as pool:
+        assert pool.map(list(range(10))) == [value * 2 for value in range(10)]
+
+
+def test_map_raises_job_errors():
+    with NewsWorkerPool(1, target=_fail_on_three) as pool:
+        with pytest.raises(RuntimeError, match="bad payload"):
+            pool.map([1, 2, 3])
+
+
+def test_map_drains_batch_after_error():
+    with NewsWorkerPool(2, target=_fail_on_three, max_sessions=4) as pool:
+        with pytest.raises(RuntimeError, match="bad payload"):
+            pool.map(list(range(8)))
+
+        assert pool.map([10, 11]) == [10, 11]
+
+
+def test_unpicklable_result_is_reported_as_error():
+    with NewsWorkerPool(1, target=_unpicklable) as pool:
+        job_id = pool.submit(1)
+        result_id, result, error = pool.get_result(timeout=30)
+
+    assert result_id == job_id
+    assert result is None
+    assert error is not None
+
+
+def test_close_drains_queued_jobs():
+    pool = NewsWorkerPool(1, target=_double, max_sessions=1)
+    pool.start()
+    job_ids = [pool.submit(value) for value in range(5)]
+    pool.close()
+
+    finished = {pool.get_result(timeout=5)[0] for _ in job_ids}
+    assert finished == set(job_ids)
+    with pytest.raises(queue.Empty):
+        pool.get_result(timeout=0)
+
+
+def test_dead_worker_raises_instead_of_hanging():
+    with NewsWorkerPool(1, target=_exit) as pool:
+        pool.submit(1)
+        with pytest.raises(RuntimeError, match="exited unexpectedly"):
+            pool.get_result(timeout=30)
+
+
+def test_initializer_failure_fails_start():
+    pool = NewsWorkerPool(1, target=_double, initializer=_broken_initializer)
+
+    with pytest.raises(RuntimeError, match="no agent"):
+        pool.start()
+
+
+def test_start_timeout_stops_workers():
+    pool = NewsWorkerPool(1, target=_double, initializer=_slow_initializer)
+
+    with pytest.raises(queue.Empty):
+        pool.start(timeout=0.5)
+    assert pool._processes == []
+
+
+def test_worker_dying_during_start_stops_workers():
+    pool = NewsWorkerPool(2, target=_double, initializer=_dying_initializer)
+
+    with pytest.raises(RuntimeError, match="exited unexpectedly"):
+        pool.start(timeout=30)
+    assert pool._processes == []
+
+
+def test_workers_can_start_parse_pool():
+    with NewsWorkerPool(1, target=_use_parse_pool, parse_workers=1) as pool:
+        assert pool.map([-1]) == [1]